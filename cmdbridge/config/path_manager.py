@@ -110,7 +110,14 @@ class PathManager:
         """
         if self._initialized:
             return
-            
+        
+        self._set_paths(config_dir, cache_dir, program_parser_config_dir)
+        self._initialized = True
+    
+    def _set_paths(self, config_dir: Optional[str] = None, 
+                   cache_dir: Optional[str] = None,
+                   program_parser_config_dir: Optional[str] = None) -> None:
+        """Set configuration and cache directory paths and ensure they exist"""
         # Set default paths
         self._config_dir = Path(
             config_dir or os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config" / "cmdbridge")
@@ -135,7 +142,6 @@ class PathManager:
         
         # Ensure directories exist
         self._ensure_directories()
-        self._initialized = True
     
     @classmethod
     def get_instance(cls) -> 'PathManager':
@@ -149,6 +155,16 @@ class PathManager:
         """Reset singleton instance (mainly for testing)"""
         cls._instance = None
     
+    @classmethod
+    def configure(cls, config_dir: Optional[str] = None,
+                  cache_dir: Optional[str] = None,
+                  program_parser_config_dir: Optional[str] = None) -> 'PathManager':
+        """Point the singleton instance at new directories, creating it if needed (mainly for testing)"""
+        if cls._instance is None or not cls._instance._initialized:
+            return cls(config_dir, cache_dir, program_parser_config_dir)
+        cls._instance._set_paths(config_dir, cache_dir, program_parser_config_dir)
+        return cls._instance
+    
     # Property accessors
     @property
     def config_dir(self) -> Path:
@@ -1,3 +1,4 @@
+import re
 import sys
 if sys.version_info >= (3, 11):
     import tomllib as tomli
@@ -9,6 +10,9 @@ from pathlib import Path
 from log import debug, info, warning, error
 from ..config.path_manager import PathManager
 
+# Matches {param} placeholders in command formats; compiled once for all calls
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
 
 class OperationMapping:
     """Operation Mapper - Generates target commands based on operation names and parameters"""
@@ -189,8 +193,7 @@ class OperationMapping:
                 warning(f"Parameter placeholder {placeholder} not found in command format")
         
         # Check if there are any remaining unplaced placeholders
-        import re
-        remaining_placeholders = re.findall(r'\{(\w+)\}', result)
+        remaining_placeholders = _PLACEHOLDER_RE.findall(result)
         if remaining_placeholders:
             warning(f"Command format still has unplaced placeholders: {remaining_placeholders}")
         
@@ -333,8 +336,7 @@ class OperationMapping:
             return []
         
         # Extract parameters from command format
-        import re
-        params = re.findall(r'\{(\w+)\}', cmd_format)
+        params = _PLACEHOLDER_RE.findall(cmd_format)
         return params
 
 
@@ -204,6 +204,9 @@ class ArgparseParser(BaseParser):
         arg_idx = 0
         arg_cnt = len(args)
 
+        # Option name -> argument configuration for this command level, built once per call
+        option_index = ArgparseParser._build_option_index(arguments_config)
+
         after_separator = False
         current_option_argconfig = None
         current_option_value_num = 0
@@ -238,7 +241,7 @@ class ArgparseParser(BaseParser):
                     debug(f"current_option_argconfig: {current_option_argconfig}")
                     raise ValueError("option_value should not start with `-`")
                 
-                option_config = ArgparseParser._find_argument_config(arg, arguments_config)
+                option_config = option_index.get(arg)
                 if option_config is not None:
                     current_positional_value_num  = 0       # Arguments starting with `-` prove positional argument calculation has ended
                     
@@ -336,11 +339,14 @@ class ArgparseParser(BaseParser):
         return tokens
 
     @staticmethod
-    def _find_argument_config(option_name: str, arguments: List[ArgumentConfig]) -> Optional[ArgumentConfig]:
+    def _build_option_index(arguments: List[ArgumentConfig]) -> Dict[str, ArgumentConfig]:
+        """Map each option name to its argument configuration (earlier configurations win on duplicate names)"""
+        option_index = {}
         for arg in arguments:
-            if arg.matches_option(option_name):
-                return arg
-        return None
+            for opt in arg.opt:
+                if opt:
+                    option_index.setdefault(opt, arg)
+        return option_index
             
 
     @staticmethod
@@ -1,7 +1,11 @@
+import sys
 from enum import Enum
 from typing import List, Optional, Union, Dict, Any
 from dataclasses import dataclass, field
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of parser config and command tree types
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # === Argument Configuration ===
 # Parser type
@@ -10,7 +14,7 @@ class ParserType(Enum):
     ARGPARSE = "argparse"
 
 # Argument configuration
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ArgumentCount:
     """Argument count specification"""
     spec: str  # argparse-style nargs specification
@@ -85,7 +89,7 @@ ArgumentCount.ZERO_OR_MORE = ArgumentCount('*')   # Zero or more
 ArgumentCount.ONE_OR_MORE = ArgumentCount('+')    # One or more
 
 # Argument configuration
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ArgumentConfig:
     """Argument configuration"""
     name: str                    # Argument name
@@ -188,7 +192,7 @@ class ArgumentConfig:
         # 3. If no valid option names found, return None
         return None
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SubCommandConfig:
     """Subcommand configuration"""
     name: str                                           # Subcommand name
@@ -248,7 +252,7 @@ class SubCommandConfig:
         
         return False
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParserConfig:
     """Parser configuration"""
     parser_type: ParserType                # Parser type
@@ -382,7 +386,7 @@ class ArgType(Enum):
     FLAG = "flag"
     EXTRA = "extra"
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommandArg:
     """Command argument in tree structure"""
     node_type: ArgType
@@ -419,7 +423,7 @@ class CommandArg:
             placeholder=data.get("placeholder")  # Deserialize placeholder
         )
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CommandNode:
     """Command tree node - tree structure where subcommands create child nodes"""
     name: str
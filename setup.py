@@ -13,6 +13,7 @@ setup(
         'dev': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
+            'pytest-xdist>=3.0.0',  # Optional: parallel test runs with `pytest -n auto`
         ],
     },
     entry_points={
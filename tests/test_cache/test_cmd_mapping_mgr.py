@@ -6,16 +6,53 @@ Test command mapping manager core functionality - Fixed version with separate co
 import sys
 import os
 import tempfile
+import shutil
 from pathlib import Path
 
-# Add project root directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from cmdbridge.cache.cmd_mapping_mgr import CmdMappingMgr
 from cmdbridge.config.path_manager import PathManager
 from cmdbridge.cache.parser_config_mgr import ParserConfigCacheMgr
 from parsers.types import ParserConfig, ParserType, ArgumentConfig, ArgumentCount
-import tomli_w
+
+
+# Pre-rendered TOML fixtures (ASCII only, written as raw bytes)
+_APT_GROUP_TOML = b"""\
+[operations.install_remote]
+cmd_format = "apt install {pkgs}"
+
+[operations.list_installed]
+cmd_format = "apt list --installed"
+"""
+
+_APT_PARSER_TOML = b"""\
+[apt.parser_config]
+parser_type = "argparse"
+program_name = "apt"
+
+[[apt.arguments]]
+name = "help"
+opt = ["-h", "--help"]
+nargs = "0"
+
+[[apt.sub_commands]]
+name = "install"
+arguments = [
+    { name = "pkgs", nargs = "+" },
+]
+
+[[apt.sub_commands]]
+name = "list"
+
+[[apt.sub_commands.arguments]]
+name = "installed"
+opt = ["--installed"]
+nargs = "0"
+"""
 
 
 def setup_test_configs():
@@ -30,9 +67,8 @@ def setup_test_configs():
     config_temp_dir.mkdir(parents=True, exist_ok=True)
     cache_temp_dir.mkdir(parents=True, exist_ok=True)
     
-    # Initialize PathManager with separate directories under same parent
-    PathManager.reset_instance()
-    path_manager = PathManager(
+    # Point the shared PathManager at separate directories under same parent
+    path_manager = PathManager.configure(
         config_dir=str(config_temp_dir),
         cache_dir=str(cache_temp_dir)
     )
@@ -46,66 +82,14 @@ def setup_test_configs():
     domain_dir.mkdir(parents=True, exist_ok=True)
     
     # Create operation group configuration file
-    group_config = {
-        "operations": {
-            "install_remote": {
-                "cmd_format": "apt install {pkgs}"
-            },
-            "list_installed": {
-                "cmd_format": "apt list --installed"
-            }
-        }
-    }
-    
-    group_file = domain_dir / "apt.toml"
-    with open(group_file, 'wb') as f:
-        tomli_w.dump(group_config, f)
+    (domain_dir / "apt.toml").write_bytes(_APT_GROUP_TOML)
     
     # Create program parser configuration directory
     parser_config_dir = path_manager.program_parser_config_dir
     parser_config_dir.mkdir(parents=True, exist_ok=True)
     
     # Create apt parser configuration
-    apt_parser_config = {
-        "apt": {
-            "parser_config": {
-                "parser_type": "argparse",
-                "program_name": "apt"
-            },
-            "arguments": [
-                {
-                    "name": "help",
-                    "opt": ["-h", "--help"],
-                    "nargs": "0"
-                }
-            ],
-            "sub_commands": [
-                {
-                    "name": "install",
-                    "arguments": [
-                        {
-                            "name": "pkgs",
-                            "nargs": "+"
-                        }
-                    ]
-                },
-                {
-                    "name": "list", 
-                    "arguments": [
-                        {
-                            "name": "installed",
-                            "opt": ["--installed"],
-                            "nargs": "0"
-                        }
-                    ]
-                }
-            ]
-        }
-    }
-    
-    apt_parser_file = parser_config_dir / "apt.toml"
-    with open(apt_parser_file, 'wb') as f:
-        tomli_w.dump(apt_parser_config, f)
+    (parser_config_dir / "apt.toml").write_bytes(_APT_PARSER_TOML)
     
     # Generate parser configuration cache
     parser_cache_mgr = ParserConfigCacheMgr()
@@ -114,27 +98,26 @@ def setup_test_configs():
     return parent_temp_dir, config_temp_dir, cache_temp_dir, path_manager
 
 
-def create_mock_parser_config():
-    """Create mock parser configuration for unit tests"""
-    return ParserConfig(
-        parser_type=ParserType.ARGPARSE,
-        program_name="apt",
-        arguments=[
-            ArgumentConfig(
-                name="pkgs",
-                opt=[],
-                nargs=ArgumentCount("+"),
-                required=False
-            ),
-            ArgumentConfig(
-                name="config_path", 
-                opt=["--config"],
-                nargs=ArgumentCount("1"),
-                required=False
-            )
-        ],
-        sub_commands=[]
-    )
+# Mock apt parser configuration for unit tests (read-only, built once)
+MOCK_PARSER_CONFIG = ParserConfig(
+    parser_type=ParserType.ARGPARSE,
+    program_name="apt",
+    arguments=[
+        ArgumentConfig(
+            name="pkgs",
+            opt=[],
+            nargs=ArgumentCount("+"),
+            required=False
+        ),
+        ArgumentConfig(
+            name="config_path", 
+            opt=["--config"],
+            nargs=ArgumentCount("1"),
+            required=False
+        )
+    ],
+    sub_commands=[]
+)
 
 
 def test_program_extraction():
@@ -166,8 +149,7 @@ def test_example_command_generation():
     
     mapping_mgr = CmdMappingMgr("test", "test")
     
-    # Create mock parser configuration
-    parser_config = create_mock_parser_config()
+    parser_config = MOCK_PARSER_CONFIG
     
     # Test command format parsing
     cmd_format = "apt install {pkgs} --config {config_path}"
@@ -191,8 +173,7 @@ def test_param_example_values():
     
     mapping_mgr = CmdMappingMgr("test", "test")
     
-    # Create mock parser configuration
-    parser_config = create_mock_parser_config()
+    parser_config = MOCK_PARSER_CONFIG
     
     # Test single-value parameter
     single_values = mapping_mgr._generate_param_example_values("config_path", parser_config)
@@ -242,7 +223,6 @@ def test_mapping_structure():
         print("✅ Mapping data structure test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -282,7 +262,6 @@ def test_file_writing():
         print("✅ File writing test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -320,7 +299,6 @@ def test_operation_processing():
         print("✅ Operation processing test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -350,7 +328,6 @@ def test_directory_separation():
         print("✅ Directory separation test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
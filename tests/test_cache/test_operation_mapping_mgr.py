@@ -3,126 +3,138 @@
 OperationMappingMgr Core Functionality Tests
 """
 
+import importlib.util
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-import tomli_w
 import sys
 
-# Add project root directory to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if sys.version_info >= (3, 11):
+    import tomllib as tomli
+else:
+    import tomli
+
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from cmdbridge.cache.operation_mapping_mgr import OperationMappingMgr, create_operation_mappings_for_domain
-from cmdbridge.config.path_manager import PathManager
+from cmdbridge.config.path_manager import PathManager, ConfigPathMgr
+
+
+# Domain base file
+BASE_TOML = b"""\
+[operations.install]
+description = "Install packages"
+args = ["pkgs"]
+
+[operations.search]
+description = "Search packages"
+args = ["query"]
+
+[operations.update]
+description = "Update packages"
+args = []
+"""
+
+# apt.toml configuration file
+APT_TOML = b"""\
+[operations."install.apt"]
+cmd_format = "apt install {pkgs}"
+
+[operations."search.apt"]
+cmd_format = "apt search {query}"
+
+[operations."update.apt"]
+cmd_format = "apt update"
+"""
+
+# pacman.toml configuration file
+PACMAN_TOML = b"""\
+[operations."install.pacman"]
+cmd_format = "pacman -S {pkgs}"
+
+[operations."search.pacman"]
+cmd_format = "pacman -Ss {query}"
+"""
+
+
+# (operation group, program, operation, expected cmd_format)
+COMMAND_FORMAT_CASES = [
+    ("apt", "apt", "install", "apt install {pkgs}"),
+    ("apt", "apt", "search", "apt search {query}"),
+    ("apt", "apt", "update", "apt update"),
+    ("pacman", "pacman", "install", "pacman -S {pkgs}"),
+    ("pacman", "pacman", "search", "pacman -Ss {query}"),
+]
+
+
+def _create_minimal_config(config_dir: Path) -> None:
+    """Create minimal test configuration"""
+    config_path_mgr = ConfigPathMgr(config_dir)
+    
+    # Create config and package.domain directories
+    package_domain_dir = config_path_mgr.get_operation_domain_dir("package")
+    package_domain_dir.mkdir(parents=True, exist_ok=True)
+    
+    # Write pre-rendered domain base, apt and pacman configuration files
+    config_path_mgr.get_domain_base_path("package").write_bytes(BASE_TOML)
+    (package_domain_dir / "apt.toml").write_bytes(APT_TOML)
+    (package_domain_dir / "pacman.toml").write_bytes(PACMAN_TOML)
+
+
+@pytest.fixture(scope="session")
+def shared_config_tree(tmp_path_factory) -> Path:
+    """Build the fixture config tree once per session under pytest's temp root"""
+    config_dir = tmp_path_factory.mktemp("shared") / "config"
+    _create_minimal_config(config_dir)
+    return config_dir
+
+
+def _configure_path_manager(parent_dir: Path) -> PathManager:
+    """Point the shared PathManager at separate config and cache directories under parent_dir"""
+    return PathManager.configure(
+        config_dir=str(parent_dir / "config"),
+        cache_dir=str(parent_dir / "cache")
+    )
+
+
+@pytest.fixture(scope="session")
+def mapping_data(shared_config_tree):
+    """Run create_mappings once per session over the shared fixture tree"""
+    _configure_path_manager(shared_config_tree.parent)
+    return OperationMappingMgr("package").create_mappings()
 
 
 class TestOperationMappingMgrSimple:
     """OperationMappingMgr simplified test class"""
     
-    def setup_method(self):
-        """Test setup"""
-        # Create a parent temporary directory
-        self.parent_temp_dir = tempfile.mkdtemp(prefix="cmdbridge_test_")
-        
-        # Create separate subdirectories for config and cache under the same parent
-        self.config_temp_dir = Path(self.parent_temp_dir) / "config"
-        self.cache_temp_dir = Path(self.parent_temp_dir) / "cache"
-        
-        self.config_temp_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Reset PathManager with separate directories under same parent
-        PathManager.reset_instance()
-        self.path_manager = PathManager(
-            config_dir=str(self.config_temp_dir),
-            cache_dir=str(self.cache_temp_dir)
-        )
-        
-        print(f"Test parent dir: {self.parent_temp_dir}")
-        print(f"Test config dir: {self.config_temp_dir}")
-        print(f"Test cache dir: {self.cache_temp_dir}")
-        
-        # Create minimal test configuration
-        self._create_minimal_config()
+    def _use_dirs(self, parent_dir: Path, path_manager: PathManager) -> None:
+        """Bind the test to config/cache directories under parent_dir"""
+        self.parent_temp_dir = parent_dir
+        self.config_temp_dir = parent_dir / "config"
+        self.cache_temp_dir = parent_dir / "cache"
+        self.path_manager = path_manager
+        
+        # Package domain paths used across tests, resolved once
+        self._pkg_op_to_program = path_manager.get_operation_to_program_path("package")
     
-    def teardown_method(self):
-        """Test cleanup"""
-        if self.parent_temp_dir and Path(self.parent_temp_dir).exists():
-            shutil.rmtree(self.parent_temp_dir)
-        PathManager.reset_instance()
+    @pytest.fixture
+    def shared_tree(self, shared_config_tree):
+        """Read-only tests use the shared fixture tree as is"""
+        parent_dir = shared_config_tree.parent
+        self._use_dirs(parent_dir, _configure_path_manager(parent_dir))
     
-    def _create_minimal_config(self):
-        """Create minimal test configuration"""
-        # Create package.domain directory
-        package_domain_dir = self.path_manager.get_operation_domain_dir_of_config("package")
-        package_domain_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create domain base file
-        base_config = {
-            "operations": {
-                "install": {
-                    "description": "Install packages",
-                    "args": ["pkgs"]
-                },
-                "search": {
-                    "description": "Search packages", 
-                    "args": ["query"]
-                },
-                "update": {
-                    "description": "Update packages",
-                    "args": []
-                }
-            }
-        }
-        
-        base_file = self.path_manager.get_domain_base_path_of_config("package")
-        with open(base_file, 'wb') as f:
-            tomli_w.dump(base_config, f)
-        
-        # Create apt.toml configuration file
-        apt_config = {
-            "operations": {
-                "install.apt": {
-                    "cmd_format": "apt install {pkgs}"
-                },
-                "search.apt": {
-                    "cmd_format": "apt search {query}"
-                },
-                "update.apt": {
-                    "cmd_format": "apt update"
-                }
-            }
-        }
-        
-        apt_file = package_domain_dir / "apt.toml"
-        with open(apt_file, 'wb') as f:
-            tomli_w.dump(apt_config, f)
-        
-        # Create pacman.toml configuration file
-        pacman_config = {
-            "operations": {
-                "install.pacman": {
-                    "cmd_format": "pacman -S {pkgs}"
-                },
-                "search.pacman": {
-                    "cmd_format": "pacman -Ss {query}"
-                }
-            }
-        }
-        
-        pacman_file = package_domain_dir / "pacman.toml"
-        with open(pacman_file, 'wb') as f:
-            tomli_w.dump(pacman_config, f)
+    @pytest.fixture
+    def mutable_tree(self, tmp_path):
+        """Tests that write get their own config tree under tmp_path"""
+        _create_minimal_config(tmp_path / "config")
+        self._use_dirs(tmp_path, _configure_path_manager(tmp_path))
     
-    def test_basic_mapping_creation(self):
+    def test_basic_mapping_creation(self, mapping_data):
         """Test basic mapping creation"""
         print("🧪 Testing basic mapping creation...")
         
-        creator = OperationMappingMgr("package")
-        mapping_data = creator.create_mappings()
-        
         # Verify returned data structure
         assert "operation_to_program" in mapping_data
         assert "command_formats_by_group" in mapping_data
@@ -141,53 +153,41 @@ class TestOperationMappingMgrSimple:
         
         print("✅ Basic mapping creation test passed")
     
-    def test_operation_to_program_structure(self):
+    def test_cached_mapping_matches_result(self, mapping_data, shared_tree):
+        """Test the generated cache file round-trips to the returned mapping"""
+        cached = tomli.loads(self._pkg_op_to_program.read_text(encoding="utf-8"))
+        assert cached["operation_to_program"] == mapping_data["operation_to_program"]
+    
+    @pytest.mark.parametrize("group", ["apt", "pacman"])
+    def test_operation_to_program_structure(self, mapping_data, group):
         """Test operation to program mapping structure"""
-        print("🧪 Testing operation to program mapping structure...")
-        
-        creator = OperationMappingMgr("package")
-        mapping_data = creator.create_mappings()
         operation_to_program = mapping_data["operation_to_program"]
         
         # Verify install operation mapping
         assert "install" in operation_to_program
         install_mapping = operation_to_program["install"]
         
-        assert "apt" in install_mapping
-        assert "pacman" in install_mapping
-        
-        # Verify program lists
-        assert "apt" in install_mapping["apt"]
-        assert "pacman" in install_mapping["pacman"]
-        
-        print("✅ Operation to program mapping structure test passed")
+        # Verify program list of the operation group
+        assert group in install_mapping
+        assert group in install_mapping[group]
     
-    def test_command_formats_collection(self):
+    @pytest.mark.parametrize("group, program, operation, expected", COMMAND_FORMAT_CASES)
+    def test_command_formats_collection(self, mapping_data, group, program, operation, expected):
         """Test command formats collection"""
-        print("🧪 Testing command formats collection...")
-        
-        creator = OperationMappingMgr("package")
-        mapping_data = creator.create_mappings()
         command_formats_by_group = mapping_data["command_formats_by_group"]
         
-        # Verify apt operation group command formats
-        assert "apt" in command_formats_by_group
-        apt_formats = command_formats_by_group["apt"]
+        # Verify operation group command formats
+        assert group in command_formats_by_group
+        program_formats = command_formats_by_group[group]
         
-        assert "apt" in apt_formats
-        apt_commands = apt_formats["apt"]
+        assert program in program_formats
+        program_commands = program_formats[program]
         
         # Verify command format content
-        assert "install" in apt_commands
-        assert apt_commands["install"] == "apt install {pkgs}"
-        assert "search" in apt_commands
-        assert apt_commands["search"] == "apt search {query}"
-        assert "update" in apt_commands
-        assert apt_commands["update"] == "apt update"
-        
-        print("✅ Command formats collection test passed")
+        assert operation in program_commands
+        assert program_commands[operation] == expected
     
-    def test_file_generation(self):
+    def test_file_generation(self, mutable_tree):
         """Test file generation"""
         print("🧪 Testing file generation...")
         
@@ -196,7 +196,7 @@ class TestOperationMappingMgrSimple:
         assert success
         
         # Verify main files were generated
-        operation_to_program_file = self.path_manager.get_operation_to_program_path("package")
+        operation_to_program_file = self._pkg_op_to_program
         assert operation_to_program_file.exists(), f"operation_to_program file should exist: {operation_to_program_file}"
         
         # Verify files are in cache directory, not config directory
@@ -217,7 +217,7 @@ class TestOperationMappingMgrSimple:
         
         print("✅ File generation test passed")
     
-    def test_program_name_extraction(self):
+    def test_program_name_extraction(self, shared_tree):
         """Test program name extraction"""
         print("🧪 Testing program name extraction...")
         
@@ -240,7 +240,7 @@ class TestOperationMappingMgrSimple:
         
         print("✅ Program name extraction test passed")
     
-    def test_convenience_function(self):
+    def test_convenience_function(self, mutable_tree):
         """Test convenience function"""
         print("🧪 Testing convenience function...")
         
@@ -253,7 +253,7 @@ class TestOperationMappingMgrSimple:
         
         print("✅ Convenience function test passed")
     
-    def test_directory_separation(self):
+    def test_directory_separation(self, shared_tree):
         """Test that config and cache directories are properly separated"""
         print("🧪 Testing directory separation...")
         
@@ -276,47 +276,12 @@ class TestOperationMappingMgrSimple:
         print("✅ Directory separation test passed")
 
 
-def run_tests():
-    """Run all tests"""
-    test_instance = TestOperationMappingMgrSimple()
-    
-    try:
-        test_instance.setup_method()
-        
-        tests = [
-            test_instance.test_basic_mapping_creation,
-            test_instance.test_operation_to_program_structure,
-            test_instance.test_command_formats_collection,
-            test_instance.test_file_generation,
-            test_instance.test_program_name_extraction,
-            test_instance.test_convenience_function,
-            test_instance.test_directory_separation,
-        ]
-        
-        passed = 0
-        failed = 0
-        
-        for test in tests:
-            try:
-                test()
-                passed += 1
-                print(f"✅ {test.__name__} - Passed")
-            except Exception as e:
-                failed += 1
-                print(f"❌ {test.__name__} - Failed: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        print(f"\n📊 Test results: {passed} passed, {failed} failed")
-        
-        if failed == 0:
-            print("🎉 All tests passed!")
-        else:
-            print("💥 Some tests failed, please check")
-            
-    finally:
-        test_instance.teardown_method()
-
-
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    args = [__file__, "-q", "-p", "no:cacheprovider"]
+    
+    # Spread tests across CPUs when the optional pytest-xdist plugin is installed
+    # (probe without importing it, so pytest can still assert-rewrite the plugin)
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto"]
+    
+    sys.exit(pytest.main(args))
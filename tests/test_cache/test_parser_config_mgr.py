@@ -6,10 +6,13 @@ Test parser configuration cache manager core functionality
 import sys
 import os
 import tempfile
+import shutil
 from pathlib import Path
 
-# Add project root directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from cmdbridge.cache.parser_config_mgr import ParserConfigCacheMgr
 from cmdbridge.config.path_manager import PathManager
@@ -30,9 +33,8 @@ def setup_test_parser_config():
     config_temp_dir.mkdir(parents=True, exist_ok=True)
     cache_temp_dir.mkdir(parents=True, exist_ok=True)
     
-    # Initialize PathManager with separate directories under same parent
-    PathManager.reset_instance()
-    path_manager = PathManager(
+    # Point the shared PathManager at separate directories under same parent
+    path_manager = PathManager.configure(
         config_dir=str(config_temp_dir),
         cache_dir=str(cache_temp_dir)
     )
@@ -100,7 +102,6 @@ def test_cache_generation_and_loading():
         print("✅ Cache generation and loading test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -136,7 +137,6 @@ def test_cache_file_content():
         print("✅ Cache file content test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -169,7 +169,6 @@ def test_directory_separation():
         print("✅ Directory separation test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
@@ -197,7 +196,6 @@ def test_cache_exists_check():
         print("✅ Cache existence check test passed")
         
     finally:
-        import shutil
         shutil.rmtree(parent_temp_dir)
 
 
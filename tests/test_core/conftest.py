@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the core tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from cmdbridge.config.path_manager import PathManager
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_path_manager_singleton():
+    """Core test classes share one PathManager singleton and repoint it with PathManager.configure"""
+    PathManager.reset_instance()
+    yield
+    PathManager.reset_instance()
@@ -3,245 +3,246 @@
 CmdMapping Tests
 """
 
+import importlib.util
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 import tomli_w
 import sys
+from typing import Dict
 
-# Add project root directory to Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
-from cmdbridge.core.cmd_mapping import CmdMapping
-from cmdbridge.config.path_manager import PathManager
+from cmdbridge.core.cmd_mapping import CmdMapping, create_cmd_mapping
+from cmdbridge.config.path_manager import PathManager, CachePathMgr
 from parsers.types import ParserConfig, ParserType, ArgumentConfig, ArgumentCount, SubCommandConfig
+from parsers.types import CommandNode, CommandArg, ArgType
 
 import log
 
-class TestCmdMapping:
-    """CmdMapping Test Class"""
-    
-    def setup_method(self):
-        """Test setup"""
-        # Create a parent temporary directory
-        self.parent_temp_dir = tempfile.mkdtemp()
-        
-        # Create separate subdirectories for config and cache under the same parent
-        self.config_temp_dir = Path(self.parent_temp_dir) / "config"
-        self.cache_temp_dir = Path(self.parent_temp_dir) / "cache"
-        
-        self.config_temp_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Reset PathManager with separate directories under same parent
-        PathManager.reset_instance()
-        self.path_manager = PathManager(
-            config_dir=str(self.config_temp_dir),
-            cache_dir=str(self.cache_temp_dir)
-        )
-        
-        print(f"Test parent dir: {self.parent_temp_dir}")
-        print(f"Test config dir: {self.config_temp_dir}")
-        print(f"Test cache dir: {self.cache_temp_dir}")
-        
-        # Create test configuration
-        self._create_test_config()
-    
-    def teardown_method(self):
-        """Test cleanup"""
-        if self.parent_temp_dir and Path(self.parent_temp_dir).exists():
-            shutil.rmtree(self.parent_temp_dir)
-        PathManager.reset_instance()
-    
-    def _create_test_config(self):
-        """Create test configuration"""
-        # Create cache directory (in cache_temp_dir)
-        cache_dir = self.path_manager.get_cmd_mappings_domain_dir_of_cache("package")
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Verify cache directory is in cache_temp_dir
-        assert str(cache_dir).startswith(str(self.cache_temp_dir)), "Cache directory should be in cache_temp_dir"
-        
-        # Create cmd_to_operation file (in cache directory)
-        cmd_to_op = {
-            "cmd_to_operation": {
-                "apt": {
-                    "programs": ["apt"]
-                },
-                "pacman": {
-                    "programs": ["pacman"]
-                }
-            }
+# cmd_to_operation cache file: operation group -> programs
+CMD_TO_OPERATION = {
+    "cmd_to_operation": {
+        "apt": {
+            "programs": ["apt"]
+        },
+        "pacman": {
+            "programs": ["pacman"]
         }
-        
-        cmd_to_op_file = self.path_manager.get_cmd_to_operation_path("package")
-        with open(cmd_to_op_file, 'wb') as f:
-            tomli_w.dump(cmd_to_op, f)
-        
-        # Verify cmd_to_operation file is in cache directory
-        assert str(cmd_to_op_file).startswith(str(self.cache_temp_dir)), "cmd_to_operation file should be in cache directory"
-        
-        # Create apt command mapping - using correct subcommand structure
-        apt_dir = self.path_manager.get_cmd_mappings_group_dir_of_cache("package", "apt")
-        apt_dir.mkdir(parents=True, exist_ok=True)
-        
-        apt_mappings = {
-            "command_mappings": [
-                {
-                    "operation": "install_remote",
-                    "cmd_format": "apt install {pkgs}",
-                    "cmd_node": {
-                        "name": "apt",
-                        "subcommand": {
-                            "name": "install",
-                            "arguments": [
-                                {
-                                    "node_type": "positional",
-                                    "values": ["__param_pkgs__"],
-                                    "placeholder": "pkgs"
-                                }
-                            ]
-                        }
-                    }
-                },
-                {
-                    "operation": "search_remote",
-                    "cmd_format": "apt search {query}",
-                    "cmd_node": {
-                        "name": "apt",
-                        "subcommand": {
-                            "name": "search",
-                            "arguments": [
-                                {
-                                    "node_type": "positional",
-                                    "values": ["__param_query__"],
-                                    "placeholder": "query"
-                                }
-                            ]
-                        }
-                    }
-                },
-                {
-                    "operation": "update",
-                    "cmd_format": "apt update",
-                    "cmd_node": {
-                        "name": "apt",
-                        "subcommand": {
-                            "name": "update",
-                            "arguments": []
-                        }
-                    }
-                }
-            ]
-        }
-        
-        apt_file = self.path_manager.get_cmd_mappings_group_program_path_of_cache(
-            "package", "apt", "apt"
-        )
-        with open(apt_file, 'wb') as f:
-            tomli_w.dump(apt_mappings, f)
-        
-        # Verify apt file is in cache directory
-        assert str(apt_file).startswith(str(self.cache_temp_dir)), "apt command file should be in cache directory"
-        
-        # Create pacman command mapping
-        pacman_dir = self.path_manager.get_cmd_mappings_group_dir_of_cache("package", "pacman")
-        pacman_dir.mkdir(parents=True, exist_ok=True)
-        
-        pacman_mappings = {
-            "command_mappings": [
-                {
-                    "operation": "install_remote",
-                    "cmd_format": "pacman -S {pkgs}",
-                    "cmd_node": {
-                        "name": "pacman",
-                        "arguments": [
-                            {
-                                "node_type": "flag",
-                                "option_name": "-S",
-                                "values": [],
-                                "repeat": 1
-                            },
-                            {
-                                "node_type": "positional",
-                                "values": ["__param_pkgs__"],
-                                "placeholder": "pkgs"
-                            }
-                        ]
-                    }
-                }
-            ]
+    }
+}
+
+
+def _apt_mapping(operation: str, subcommand: str, placeholder: str = None) -> dict:
+    """Build one apt command mapping entry, optionally with a single positional parameter"""
+    arguments = []
+    cmd_format = f"apt {subcommand}"
+    if placeholder:
+        arguments.append(CommandArg(ArgType.POSITIONAL, values=[f"__param_{placeholder}__"], placeholder=placeholder))
+        cmd_format += f" {{{placeholder}}}"
+    return {
+        "operation": operation,
+        "cmd_format": cmd_format,
+        "cmd_node": CommandNode(
+            name="apt",
+            subcommand=CommandNode(name=subcommand, arguments=arguments)
+        ).to_dict()
+    }
+
+
+# apt command mappings - using correct subcommand structure (serialized once at import)
+APT_MAPPINGS = {
+    "command_mappings": [
+        _apt_mapping("install_remote", "install", "pkgs"),
+        _apt_mapping("search_remote", "search", "query"),
+        _apt_mapping("update", "update"),
+    ]
+}
+
+
+# pacman command mappings (serialized once at import)
+PACMAN_MAPPINGS = {
+    "command_mappings": [
+        {
+            "operation": "install_remote",
+            "cmd_format": "pacman -S {pkgs}",
+            "cmd_node": CommandNode(
+                name="pacman",
+                arguments=[
+                    CommandArg(ArgType.FLAG, option_name="-S", repeat=1),
+                    CommandArg(ArgType.POSITIONAL, values=["__param_pkgs__"], placeholder="pkgs")
+                ]
+            ).to_dict()
         }
-        
-        pacman_file = self.path_manager.get_cmd_mappings_group_program_path_of_cache(
-            "package", "pacman", "pacman"
+    ]
+}
+
+
+# In-memory mapping config for create_cmd_mapping
+CONVENIENCE_CONFIG = {
+    "test_program": {
+        "command_mappings": [
+            {
+                "operation": "test_op",
+                "cmd_format": "test {param}",
+                "cmd_node": CommandNode(
+                    name="test",
+                    arguments=[CommandArg(ArgType.POSITIONAL, values=["__param_param__"], placeholder="param")]
+                ).to_dict()
+            }
+        ]
+    }
+}
+
+
+# apt parser configuration
+APT_PARSER_CONFIG = ParserConfig(
+    parser_type=ParserType.ARGPARSE,
+    program_name="apt",
+    arguments=[
+        ArgumentConfig(
+            name="help",
+            opt=["-h", "--help"],
+            nargs=ArgumentCount.ZERO
         )
-        with open(pacman_file, 'wb') as f:
-            tomli_w.dump(pacman_mappings, f)
-        
-        # Verify pacman file is in cache directory
-        assert str(pacman_file).startswith(str(self.cache_temp_dir)), "pacman command file should be in cache directory"
-    
-    def _create_apt_parser_config(self) -> ParserConfig:
-        """Create apt parser configuration"""
-        return ParserConfig(
-            parser_type=ParserType.ARGPARSE,
-            program_name="apt",
+    ],
+    sub_commands=[
+        SubCommandConfig(
+            name="install",
             arguments=[
                 ArgumentConfig(
-                    name="help",
-                    opt=["-h", "--help"],
-                    nargs=ArgumentCount.ZERO
-                )
-            ],
-            sub_commands=[
-                SubCommandConfig(
-                    name="install",
-                    arguments=[
-                        ArgumentConfig(
-                            name="packages",
-                            opt=[],  # positional argument
-                            nargs=ArgumentCount.ONE_OR_MORE
-                        )
-                    ]
-                ),
-                SubCommandConfig(
-                    name="search",
-                    arguments=[
-                        ArgumentConfig(
-                            name="query",
-                            opt=[],  # positional argument
-                            nargs=ArgumentCount.ONE_OR_MORE
-                        )
-                    ]
-                ),
-                SubCommandConfig(
-                    name="update",
-                    arguments=[]  # no arguments
+                    name="packages",
+                    opt=[],  # positional argument
+                    nargs=ArgumentCount.ONE_OR_MORE
                 )
             ]
-        )
-    
-    def _create_pacman_parser_config(self) -> ParserConfig:
-        """Create pacman parser configuration"""
-        return ParserConfig(
-            parser_type=ParserType.GETOPT,
-            program_name="pacman",
+        ),
+        SubCommandConfig(
+            name="search",
             arguments=[
                 ArgumentConfig(
-                    name="sync",
-                    opt=["-S", ""],
-                    nargs=ArgumentCount.ZERO
-                ),
-                ArgumentConfig(
-                    name="packages",
+                    name="query",
                     opt=[],  # positional argument
                     nargs=ArgumentCount.ONE_OR_MORE
                 )
-            ],
-            sub_commands=[]
+            ]
+        ),
+        SubCommandConfig(
+            name="update",
+            arguments=[]  # no arguments
+        )
+    ]
+)
+
+# pacman parser configuration
+PACMAN_PARSER_CONFIG = ParserConfig(
+    parser_type=ParserType.GETOPT,
+    program_name="pacman",
+    arguments=[
+        ArgumentConfig(
+            name="sync",
+            opt=["-S", ""],
+            nargs=ArgumentCount.ZERO
+        ),
+        ArgumentConfig(
+            name="packages",
+            opt=[],  # positional argument
+            nargs=ArgumentCount.ONE_OR_MORE
+        )
+    ],
+    sub_commands=[]
+)
+
+
+# (operation group, source cmdline, expected operation, expected params)
+MAPPING_CASES = [
+    pytest.param("apt", APT_PARSER_CONFIG, ["apt", "install", "vim", "git"], "install_remote", {"pkgs": "vim git"}, id="basic"),
+    pytest.param("apt", APT_PARSER_CONFIG, ["apt", "search", "python"], "search_remote", {"query": "python"}, id="search"),
+    pytest.param("apt", APT_PARSER_CONFIG, ["apt", "update"], "update", {}, id="no_parameters"),
+    pytest.param("pacman", PACMAN_PARSER_CONFIG, ["pacman", "-S", "vim", "git"], "install_remote", {"pkgs": "vim git"}, id="pacman"),
+]
+
+
+# Cache file contents, TOML-encoded once at import
+CMD_TO_OPERATION_TOML = tomli_w.dumps(CMD_TO_OPERATION).encode("utf-8")
+APT_MAPPINGS_TOML = tomli_w.dumps(APT_MAPPINGS).encode("utf-8")
+PACMAN_MAPPINGS_TOML = tomli_w.dumps(PACMAN_MAPPINGS).encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def prebuilt_cache(tmp_path_factory) -> Path:
+    """Write the command mapping cache tree once per session; tests only read it"""
+    # Parent directory under pytest's session temp root, with separate config and cache subdirectories
+    parent_dir = tmp_path_factory.mktemp("cmdmap")
+    cache_path_mgr = CachePathMgr(parent_dir / "cache")
+    groups = (("apt", APT_MAPPINGS_TOML), ("pacman", PACMAN_MAPPINGS_TOML))
+    
+    # Create config and all cache directories
+    leaf_dirs = [parent_dir / "config"] + [
+        cache_path_mgr.get_cmd_mappings_group_dir("package", group) for group, _ in groups
+    ]
+    for leaf_dir in leaf_dirs:
+        leaf_dir.mkdir(parents=True, exist_ok=True)
+    
+    # cmd_to_operation file and per-program command mappings
+    cache_path_mgr.get_cmd_to_operation_path("package").write_bytes(CMD_TO_OPERATION_TOML)
+    
+    for group, mappings_toml in groups:
+        cache_path_mgr.get_cmd_mappings_group_program_path("package", group, group).write_bytes(mappings_toml)
+    
+    # The directory tree is cleaned up with pytest's session temp root
+    return parent_dir
+
+
+@pytest.fixture(scope="module")
+def cmd_mappings() -> Dict[str, CmdMapping]:
+    """Per-group command mappings built in memory, in the shape load_from_cache returns"""
+    return {
+        "apt": create_cmd_mapping({"apt": APT_MAPPINGS}),
+        "pacman": create_cmd_mapping({"pacman": PACMAN_MAPPINGS}),
+    }
+
+
+class TestCmdMappingInMemory:
+    """CmdMapping tests that need no on-disk cache"""
+    
+    @pytest.mark.parametrize("group,parser_config,cmdline,expected_operation,expected_params", MAPPING_CASES)
+    def test_command_mapping(self, cmd_mappings, group, parser_config, cmdline, expected_operation, expected_params):
+        """Test mapping source command lines to operations and parameters"""
+        result = cmd_mappings[group].map_to_operation(
+            source_cmdline=cmdline,
+            source_parser_config=parser_config,
+            dst_operation_group=group
+        )
+        
+        assert result is not None, f"no mapping found for {cmdline}"
+        assert result["operation_name"] == expected_operation
+        assert result["params"] == expected_params
+    
+    def test_convenience_function(self):
+        """Test convenience function"""
+        mapping = create_cmd_mapping(CONVENIENCE_CONFIG)
+        assert mapping is not None
+        assert "test_program" in mapping.mapping_config
+
+
+class TestCmdMappingFromCache:
+    """CmdMapping tests that load from the on-disk cache"""
+    
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def mapping_cache(cls, prebuilt_cache):
+        """Point PathManager at the prebuilt cache tree for the whole class"""
+        cls.parent_temp_dir = prebuilt_cache
+        cls.config_temp_dir = prebuilt_cache / "config"
+        cls.cache_temp_dir = prebuilt_cache / "cache"
+        
+        # Point the shared PathManager at separate directories under same parent
+        cls.path_manager = PathManager.configure(
+            config_dir=str(cls.config_temp_dir),
+            cache_dir=str(cls.cache_temp_dir)
         )
     
     def test_load_from_cache(self):
@@ -253,100 +254,13 @@ class TestCmdMapping:
         
         command_mappings = mapping.mapping_config["apt"]["command_mappings"]
         assert len(command_mappings) == 3
+        # The cache round-trips to the data the in-memory tests map with
+        assert mapping.mapping_config["apt"] == APT_MAPPINGS
         
         # Test loading non-existent program
         nonexistent = CmdMapping.load_from_cache("package", "nonexistent")
         assert nonexistent.mapping_config == {}
     
-    def test_basic_command_mapping(self):
-        """Test basic command mapping"""
-        mapping = CmdMapping.load_from_cache("package", "apt")
-        parser_config = self._create_apt_parser_config()
-        
-        result = mapping.map_to_operation(
-            source_cmdline=["apt", "install", "vim", "git"],
-            source_parser_config=parser_config,
-            dst_operation_group="apt"
-        )
-        
-        assert result is not None
-        assert result["operation_name"] == "install_remote"
-        assert result["params"]["pkgs"] == "vim git"
-    
-    def test_search_command_mapping(self):
-        """Test search command mapping"""
-        mapping = CmdMapping.load_from_cache("package", "apt")
-        parser_config = self._create_apt_parser_config()
-        
-        result = mapping.map_to_operation(
-            source_cmdline=["apt", "search", "python"],
-            source_parser_config=parser_config,
-            dst_operation_group="apt"
-        )
-        
-        assert result is not None
-        assert result["operation_name"] == "search_remote"
-        assert result["params"]["query"] == "python"
-    
-    def test_no_parameters_command(self):
-        """Test command without parameters"""
-        mapping = CmdMapping.load_from_cache("package", "apt")
-        parser_config = self._create_apt_parser_config()
-        
-        result = mapping.map_to_operation(
-            source_cmdline=["apt", "update"],
-            source_parser_config=parser_config,
-            dst_operation_group="apt"
-        )
-        
-        assert result is not None
-        assert result["operation_name"] == "update"
-        assert result["params"] == {}  # no parameters
-    
-    def test_pacman_command_mapping(self):
-        """Test pacman command mapping"""
-        mapping = CmdMapping.load_from_cache("package", "pacman")
-        parser_config = self._create_pacman_parser_config()
-        
-        result = mapping.map_to_operation(
-            source_cmdline=["pacman", "-S", "vim", "git"],
-            source_parser_config=parser_config,
-            dst_operation_group="pacman"
-        )
-        
-        assert result is not None
-        assert result["operation_name"] == "install_remote"
-        assert result["params"]["pkgs"] == "vim git"
-    
-    def test_convenience_function(self):
-        """Test convenience function"""
-        from cmdbridge.core.cmd_mapping import create_cmd_mapping
-        
-        test_config = {
-            "test_program": {
-                "command_mappings": [
-                    {
-                        "operation": "test_op",
-                        "cmd_format": "test {param}",
-                        "cmd_node": {
-                            "name": "test",
-                            "arguments": [
-                                {
-                                    "node_type": "positional",
-                                    "values": ["__param_param__"],
-                                    "placeholder": "param"
-                                }
-                            ]
-                        }
-                    }
-                ]
-            }
-        }
-        
-        mapping = create_cmd_mapping(test_config)
-        assert mapping is not None
-        assert "test_program" in mapping.mapping_config
-    
     def test_directory_separation(self):
         """Test that config and cache directories are properly separated"""
         # Verify directories are different but under same parent
@@ -359,21 +273,24 @@ class TestCmdMapping:
         
         # Verify all created files are in cache directory, not config directory
         cache_dir = self.path_manager.get_cmd_mappings_domain_dir_of_cache("package")
-        assert str(cache_dir).startswith(str(self.cache_temp_dir)), "Cache files should be in cache directory"
+        assert self.cache_temp_dir in cache_dir.parents, "Cache files should be in cache directory"
         
         cmd_to_op_file = self.path_manager.get_cmd_to_operation_path("package")
-        assert str(cmd_to_op_file).startswith(str(self.cache_temp_dir)), "cmd_to_operation file should be in cache directory"
+        assert self.cache_temp_dir in cmd_to_op_file.parents, "cmd_to_operation file should be in cache directory"
         
         apt_file = self.path_manager.get_cmd_mappings_group_program_path_of_cache("package", "apt", "apt")
-        assert str(apt_file).startswith(str(self.cache_temp_dir)), "apt command file should be in cache directory"
+        assert self.cache_temp_dir in apt_file.parents, "apt command file should be in cache directory"
         
         pacman_file = self.path_manager.get_cmd_mappings_group_program_path_of_cache("package", "pacman", "pacman")
-        assert str(pacman_file).startswith(str(self.cache_temp_dir)), "pacman command file should be in cache directory"
-
+        assert self.cache_temp_dir in pacman_file.parents, "pacman command file should be in cache directory"
 
 if __name__ == "__main__":
-    # Set log level
+    # Debug logs are captured and only shown for failing tests
     log.set_level(log.LogLevel.DEBUG)
     
-    import pytest
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    args = [__file__, "-v"]
+    # Probe for pytest-xdist without importing it, so pytest can still assert-rewrite the plugin;
+    # loadscope keeps each class on one worker, so class fixtures run once
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist", "loadscope"]
+    sys.exit(pytest.main(args))
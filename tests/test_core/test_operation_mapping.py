@@ -4,190 +4,130 @@ OperationMapping Core Functionality Tests
 """
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-import tomli_w
 import sys
 
-if sys.version_info >= (3, 11):
-    import tomllib as tomli
-else:
-    import tomli
-
-# Add project root directory to Python path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from cmdbridge.core.operation_mapping import OperationMapping
 from cmdbridge.config.path_manager import PathManager
 
 
+# Operation to program mapping cache file, stored pre-serialized as TOML bytes
+OP_TO_PROGRAM_TOML = b"""\
+[operation_to_program.install]
+apt = ["apt"]
+
+[operation_to_program.search]
+apt = ["apt"]
+
+[operation_to_program.update]
+apt = ["apt"]
+"""
+
+# apt command formats cache file, stored pre-serialized as TOML bytes
+APT_COMMANDS_TOML = b"""\
+[commands]
+install = "apt install {pkgs}"
+search = "apt search {query}"
+update = "apt update"
+"""
+
+
+# (operation, params, expected apt command)
+COMMAND_GENERATION_CASES = [
+    pytest.param("install", {"pkgs": "vim git"}, "apt install vim git", id="basic"),
+    pytest.param("search", {"query": "python"}, "apt search python", id="search"),
+    pytest.param("update", {}, "apt update", id="no_parameters"),
+    pytest.param("install", {"pkgs": "vim"}, "apt install vim", id="single_parameter_value"),
+    pytest.param("install", {"pkgs": "vim git curl"}, "apt install vim git curl", id="multiple_parameter_values"),
+]
+
+
 class TestOperationMapping:
     """OperationMapping Core Functionality Tests"""
     
-    def setup_method(self):
-        """Test setup"""
-        # Create a parent temporary directory
-        self.parent_temp_dir = tempfile.mkdtemp()
-        
-        # Create separate subdirectories for config and cache under the same parent
-        self.config_temp_dir = Path(self.parent_temp_dir) / "config"
-        self.cache_temp_dir = Path(self.parent_temp_dir) / "cache"
-        
-        self.config_temp_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_temp_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Reset PathManager with separate directories under same parent
-        PathManager.reset_instance()
-        self.path_manager = PathManager(
-            config_dir=str(self.config_temp_dir),
-            cache_dir=str(self.cache_temp_dir)
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def operation_cache(cls, tmp_path_factory):
+        """Build the read-only test tree once for the whole class"""
+        # Parent directory under pytest's session temp root (cleaned up by pytest)
+        cls.parent_temp_dir = tmp_path_factory.mktemp("opmap")
+        
+        # Separate subdirectories for config and cache under the same parent
+        cls.config_temp_dir = cls.parent_temp_dir / "config"
+        cls.cache_temp_dir = cls.parent_temp_dir / "cache"
+        
+        # Point the shared PathManager at them (this creates both directories)
+        cls.path_manager = PathManager.configure(
+            config_dir=str(cls.config_temp_dir),
+            cache_dir=str(cls.cache_temp_dir)
         )
         
-        print(f"Test parent dir: {self.parent_temp_dir}")
-        print(f"Test config dir: {self.config_temp_dir}")
-        print(f"Test cache dir: {self.cache_temp_dir}")
+        # Package domain paths used across setup and tests, resolved once
+        cls._pkg_config_dir = cls.path_manager.get_operation_domain_dir_of_config("package")
+        cls._pkg_cache_dir = cls.path_manager.get_operation_mappings_domain_dir_of_cache("package")
+        cls._apt_cache_dir = cls.path_manager.get_operation_mappings_group_dir_of_cache("package", "apt")
+        cls._op_to_program_file = cls.path_manager.get_operation_to_program_path("package")
+        cls._apt_commands_file = cls.path_manager.get_operation_mappings_group_program_path_of_cache(
+            "package", "apt", "apt"
+        )
         
-        # Create domain configuration directory
-        package_domain_dir = self.path_manager.get_operation_domain_dir_of_config("package")
-        package_domain_dir.mkdir(parents=True, exist_ok=True)
+        # Create domain configuration and apt cache directories
+        for leaf_dir in (cls._pkg_config_dir, cls._apt_cache_dir):
+            leaf_dir.mkdir(parents=True, exist_ok=True)
         
         # Create test configuration
-        self._create_test_config()
-    
-    def teardown_method(self):
-        """Test cleanup"""
-        if self.parent_temp_dir and Path(self.parent_temp_dir).exists():
-            shutil.rmtree(self.parent_temp_dir)
-        PathManager.reset_instance()
+        cls._create_test_config()
+        
+        # Shared mapper; tests only read from it, so the cache is parsed once
+        cls.mapping = OperationMapping()
     
-    def _create_test_config(self):
+    @classmethod
+    def _create_test_config(cls):
         """Create test configuration"""
-        # Create cache directory (in cache_temp_dir)
-        cache_dir = self.path_manager.get_operation_mappings_domain_dir_of_cache("package")
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_prefix = str(cls.cache_temp_dir)
         
         # Verify cache directory is in cache_temp_dir
-        assert str(cache_dir).startswith(str(self.cache_temp_dir)), "Cache directory should be in cache_temp_dir"
+        assert str(cls._pkg_cache_dir).startswith(cache_prefix), "Cache directory should be in cache_temp_dir"
         
         # Create operation to program mapping file (in cache directory)
-        op_to_program = {
-            "operation_to_program": {
-                "install": {
-                    "apt": ["apt"]
-                },
-                "search": {
-                    "apt": ["apt"]
-                },
-                "update": {
-                    "apt": ["apt"]
-                }
-            }
-        }
-        
-        op_file = self.path_manager.get_operation_to_program_path("package")
-        with open(op_file, 'wb') as f:
-            tomli_w.dump(op_to_program, f)
+        cls._op_to_program_file.write_bytes(OP_TO_PROGRAM_TOML)
         
         # Verify operation to program file is in cache directory
-        assert str(op_file).startswith(str(self.cache_temp_dir)), "operation_to_program file should be in cache directory"
+        assert str(cls._op_to_program_file).startswith(cache_prefix), "operation_to_program file should be in cache directory"
         
         # Create apt command format (in cache directory)
-        apt_dir = self.path_manager.get_operation_mappings_group_dir_of_cache("package", "apt")
-        apt_dir.mkdir(parents=True, exist_ok=True)
-        
-        apt_commands = {
-            "commands": {
-                "install": "apt install {pkgs}",
-                "search": "apt search {query}",
-                "update": "apt update"
-            }
-        }
-        
-        apt_file = self.path_manager.get_operation_mappings_group_program_path_of_cache(
-            "package", "apt", "apt"
-        )
-        with open(apt_file, 'wb') as f:
-            tomli_w.dump(apt_commands, f)
+        cls._apt_commands_file.write_bytes(APT_COMMANDS_TOML)
         
         # Verify apt command file is in cache directory
-        assert str(apt_file).startswith(str(self.cache_temp_dir)), "apt command file should be in cache directory"
+        assert str(cls._apt_commands_file).startswith(cache_prefix), "apt command file should be in cache directory"
     
-    def test_basic_command_generation(self):
-        """Test basic command generation"""
-        mapping = OperationMapping()
-        
-        cmd = mapping.generate_command(
-            operation_name="install",
-            params={"pkgs": "vim git"},
+    @pytest.mark.parametrize("operation_name,params,expected", COMMAND_GENERATION_CASES)
+    def test_command_generation(self, operation_name, params, expected):
+        """Test generating apt commands from operations and parameters"""
+        cmd = self.mapping.generate_command(
+            operation_name=operation_name,
+            params=params,
             dst_operation_domain_name="package",
             dst_operation_group_name="apt"
         )
         
-        assert cmd == "apt install vim git"
-    
-    def test_search_command(self):
-        """Test search command"""
-        mapping = OperationMapping()
-        
-        cmd = mapping.generate_command(
-            operation_name="search",
-            params={"query": "python"},
-            dst_operation_domain_name="package",
-            dst_operation_group_name="apt"
-        )
-        
-        assert cmd == "apt search python"
-    
-    def test_no_parameters_command(self):
-        """Test command without parameters"""
-        mapping = OperationMapping()
-        
-        cmd = mapping.generate_command(
-            operation_name="update",
-            params={},
-            dst_operation_domain_name="package",
-            dst_operation_group_name="apt"
-        )
-        
-        assert cmd == "apt update"
+        assert cmd == expected
     
     def test_nonexistent_operation(self):
         """Test non-existent operation"""
-        mapping = OperationMapping()
-        
-        with pytest.raises(ValueError):
-            mapping.generate_command(
+        with pytest.raises(ValueError, match="Operation nonexistent does not support operation group apt"):
+            self.mapping.generate_command(
                 operation_name="nonexistent",
                 params={},
                 dst_operation_domain_name="package",
                 dst_operation_group_name="apt"
             )
     
-    def test_parameter_replacement(self):
-        """Test parameter replacement"""
-        mapping = OperationMapping()
-        
-        cmd = mapping.generate_command(
-            operation_name="install",
-            params={"pkgs": "vim"},
-            dst_operation_domain_name="package",
-            dst_operation_group_name="apt"
-        )
-        
-        assert cmd == "apt install vim"
-        
-        # Test multiple parameters
-        cmd = mapping.generate_command(
-            operation_name="install",
-            params={"pkgs": "vim git curl"},
-            dst_operation_domain_name="package",
-            dst_operation_group_name="apt"
-        )
-        
-        assert cmd == "apt install vim git curl"
-    
     def test_directory_separation(self):
         """Test that config and cache directories are properly separated"""
         # Verify directories are different but under same parent
@@ -212,46 +152,5 @@ class TestOperationMapping:
         # For this test, we're only creating cache files, so no config files to verify
 
 
-def run_tests():
-    """Run all tests"""
-    test_instance = TestOperationMapping()
-    
-    try:
-        test_instance.setup_method()
-        
-        tests = [
-            test_instance.test_basic_command_generation,
-            test_instance.test_search_command,
-            test_instance.test_no_parameters_command,
-            test_instance.test_nonexistent_operation,
-            test_instance.test_parameter_replacement,
-            test_instance.test_directory_separation,
-        ]
-        
-        passed = 0
-        failed = 0
-        
-        for test in tests:
-            try:
-                test()
-                passed += 1
-                print(f"✅ {test.__name__} - Passed")
-            except Exception as e:
-                failed += 1
-                print(f"❌ {test.__name__} - Failed: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        print(f"\n📊 Test results: {passed} passed, {failed} failed")
-        
-        if failed == 0:
-            print("🎉 All tests passed!")
-        else:
-            print("💥 Some tests failed, please check")
-            
-    finally:
-        test_instance.teardown_method()
-
-
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    pytest.main([__file__, "-v"])
@@ -7,8 +7,10 @@ import sys
 import os
 from pathlib import Path
 
-# Add project root directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add project root directory to Python path (once)
+project_root = str(Path(__file__).parent.parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from parsers.config_loader import ConfigLoader, load_parser_config_from_data
 from parsers.types import ParserType